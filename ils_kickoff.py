@@ -12,24 +12,30 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-import calendar
 import re
+import io
+import math
 import os
 import warnings
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
 
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend
 import matplotlib.pyplot as plt
+from lxml import etree
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.drawing.image import Image as XLImage
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+try:  # private python-pptx API, only used to pick the deflate level in save_pptx()
+    from pptx.opc.serialized import _ZipPkgWriter
+except ImportError:
+    _ZipPkgWriter = None
 
 warnings.filterwarnings("ignore")
 pd.set_option("display.max_columns", 100)
@@ -41,16 +47,17 @@ plt.rcParams["savefig.bbox"] = "tight"
 plt.rcParams["savefig.dpi"] = 300
 plt.rcParams["figure.figsize"] = (10, 6)
 
+# Deflate level for the .pptx/.xlsx zips: level 1 roughly halves compression CPU vs the
+# default 6 for a few percent larger files. python-pptx has no option, so save_pptx()
+# patches its zip writer for the duration of the save
+ZIP_LEVEL = 1
+
 # ═══════════════════════════════════════════════════════════════════
 # 2. DATA LOADING & CLEANING
 # ═══════════════════════════════════════════════════════════════════
 DATA_PATH = Path("1774_INB_OD_Tran_Combo_20260203__1_.csv")
 
-print(f"Loading: {DATA_PATH.name}")
-df = pd.read_csv(DATA_PATH, encoding="utf-8-sig", low_memory=False)
-print(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
-
-# ── Rename columns to canonical names ──
+# Source header → canonical name
 RENAME_MAP = {
     "TOTALITEMS": "Total Items",
     "PaidItems": "Paid Items",
@@ -68,30 +75,81 @@ RENAME_MAP = {
     "swipes": "Swipes",
     "spend": "Spend",
 }
-df.rename(columns=RENAME_MAP, inplace=True)
 
-# ── Fix DepositCount: extract first value before embedded tabs ──
-df["Deposit Count"] = (
-    df["Deposit Count"]
-    .astype(str)
-    .str.split("\t")
-    .str[0]
-    .pipe(pd.to_numeric, errors="coerce")
-    .fillna(0)
-    .astype(int)
+# Only the mapped columns (plus the account key) are parsed; the rest of the extract is skipped
+SOURCE_COLS = ["AcctNo"] + list(RENAME_MAP.keys())
+
+print(f"Loading: {DATA_PATH.name}")
+# Pin types the Arrow reader can't infer: Deposit Count / Open Date are cleaned below,
+# Returned Items is entirely blank in the extract.
+SOURCE_DTYPES = {
+    "DepositCount": str,
+    "OpenDate": str,
+    "ReturnedItems": "float64",
+}
+
+# Multithreaded Arrow parser. Frames stay NumPy-backed: an empty segment's mean is then
+# NaN rather than pd.NA, which the rounding and formatting below rely on.
+df = pd.read_csv(
+    DATA_PATH,
+    encoding="utf-8-sig",
+    engine="pyarrow",
+    usecols=SOURCE_COLS,
+    dtype=SOURCE_DTYPES,
 )
+print(f"Shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
+
+# ── Rename columns to canonical names ──
+df.rename(columns=RENAME_MAP, inplace=True)
+
+# ── Fix DepositCount: most values parse directly; re-parse only the few with
+#    embedded tabs by taking the text before the first tab. to_numeric strips
+#    surrounding whitespace, so "\t7" parses on its own and must be re-parsed too ──
+dep_raw = df["Deposit Count"]
+dep_num = pd.to_numeric(dep_raw, errors="coerce")
+dep_bad = dep_raw.str.contains("\t", regex=False, na=False) | (dep_num.isna() & dep_raw.notna())
+if dep_bad.any():
+    dep_first = dep_raw.loc[dep_bad].astype(str).str.split("\t").str[0]
+    dep_num = dep_num.mask(dep_bad, pd.to_numeric(dep_first, errors="coerce"))
+df["Deposit Count"] = dep_num.fillna(0).astype(np.int32)
 
 # ── Fix Returned Items (all NaN → 0) ──
 df["Returned Items"] = df["Returned Items"].fillna(0).astype(int)
 
-# ── Parse Open Date ──
-df["Open Date"] = pd.to_datetime(df["Open Date"], errors="coerce")
-df["Year Opened"] = df["Open Date"].dt.year
+# ── Parse Open Date: sniff the layout once and pass an explicit format so the
+#    parser skips per-value inference (unrecognised layouts still fall back to it) ──
+open_idx = df["Open Date"].first_valid_index()
+open_first = str(df.at[open_idx, "Open Date"]).strip() if open_idx is not None else ""
+if re.fullmatch(r"\d{4}-\d{2}-\d{2}.*", open_first):
+    OPEN_DATE_FORMAT = "ISO8601"
+elif re.fullmatch(r"\d{1,2}/\d{1,2}/\d{4}", open_first):
+    OPEN_DATE_FORMAT = "%m/%d/%Y"
+else:
+    OPEN_DATE_FORMAT = None
+df["Open Date"] = pd.to_datetime(df["Open Date"], format=OPEN_DATE_FORMAT, errors="coerce")
+df["Year Opened"] = df["Open Date"].dt.year.astype("Int32")
 
 # ── Ensure numerics ──
 for col in ["Total Items", "Paid Items", "OD Limit", "Avg Bal", "Deposit Amount", "Swipes", "Spend"]:
     df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
 
+# ── Narrowest dtypes for the count columns every groupby scans. Signed, so group
+#    sums still come back as int64; dollar amounts stay float64 to keep cents exact.
+#    Only columns the extract already stores as integers: a float column turned int
+#    would change how its sums render in the deck ("0" instead of "0.00") ──
+for col in ["Total Items", "Paid Items", "Swipes"]:
+    if pd.api.types.is_integer_dtype(df[col]):
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+# OD Limit is a group key (Analysis 14): whole dollars as int32 keeps it on the integer hash path.
+# Fractional limits stay float64 so averages aren't truncated and 100 / 100.5 stay separate groups
+if (df["OD Limit"] % 1 == 0).all():
+    df["OD Limit"] = df["OD Limit"].astype(np.int32)
+
+# ── Low-cardinality group keys as categoricals (int codes instead of string hashing) ──
+for col in ["Account Status", "Business Flag", "OD Status", "Reg E Flag"]:
+    df[col] = df[col].astype("category")
+
 print(f"Columns: {list(df.columns)}")
 print(f"Account Status values: {sorted(df['Account Status'].unique())}")
 print(f"Business Flag values: {sorted(df['Business Flag'].unique())}")
@@ -103,72 +161,151 @@ print(f"Reg E Flag values: {sorted(df['Reg E Flag'].dropna().unique())}")
 
 def add_grand_total(summary_df, label_col, label="Grand Total"):
     """Add a Grand Total row to a summary DataFrame."""
-    totals = {}
+    # One vectorized pass. A mixed int/float sum comes back as float64, so integer columns are
+    # promoted to int64 – never cast back to the source width (an int8 total can overflow)
+    sums = {
+        col: np.int64(v) if pd.api.types.is_integer_dtype(summary_df[col]) else v
+        for col, v in summary_df.sum(numeric_only=True).items()
+    }
+    totals = {col: sums.get(col, np.nan) for col in summary_df.columns}
+    totals[label_col] = label
     for col in summary_df.columns:
-        if col == label_col:
-            totals[col] = label
-        elif "%" in col or "Ratio" in col.lower() or "Avg" in col or "Average" in col or "Med" in col:
+        if col != label_col and any(k in col for k in ("%", "Ratio", "Avg", "Average", "Med")):
             # Recalculate percentage/ratio from totals
             totals[col] = np.nan  # placeholder
-        else:
-            totals[col] = summary_df[col].sum()
     return totals
 
 
+def bin_codes(values, bins, labels):
+    """Right-inclusive binning equivalent to pd.cut, done as one searchsorted pass over a raw array."""
+    x = np.asarray(values, dtype=np.float64)
+    codes = np.searchsorted(bins[1:-1], x, side="left").astype(np.int8)
+    codes[~((x > bins[0]) & (x <= bins[-1]))] = -1  # out of range / NaN → missing
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
+def pct_of_total(values, total=None, decimals=2):
+    """Percent share of each value in the column total, computed on the raw array."""
+    arr = values.to_numpy(dtype=np.float64)
+    total = arr.sum() if total is None else total
+    if not total > 0:
+        return np.zeros_like(arr)
+    return np.round(arr / total * 100, decimals)
+
+
+def pay_ratio(paid, items, scale=1, decimals=2):
+    """Paid / presented items per row (0 where nothing was presented), on raw arrays."""
+    num = paid.to_numpy(dtype=np.float64)
+    den = items.to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, np.round(num / den * scale, decimals), 0)
+
+
+def append_totals(summary_df, totals):
+    """Append a totals row (dict keyed by column) to a summary DataFrame in place."""
+    # Categorical label columns (bins, status codes) need the total label as a category
+    for col, val in totals.items():
+        dtype = summary_df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype) and pd.notna(val) and val not in dtype.categories:
+            summary_df[col] = summary_df[col].cat.add_categories([val])
+    dtypes = summary_df.dtypes
+    summary_df.loc[len(summary_df)] = totals
+    # Enlarging an empty frame re-infers dtypes from the totals row alone; keep float columns float
+    for col, dtype in dtypes.items():
+        if dtype.kind == "f" and summary_df[col].dtype.kind != "f":
+            summary_df[col] = summary_df[col].astype(dtype)
+    return summary_df
+
+
+def trim(df):
+    """Drop trailing all-NaN rows so the writers never walk empty rows at the end."""
+    has_data = df.notna().to_numpy().any(axis=1)
+    if has_data.size == 0 or has_data[-1]:
+        return df
+    return df.iloc[: len(has_data) - int(has_data[::-1].argmax())] if has_data.any() else df.iloc[:0]
+
+
+def pick_fmt(col_name):
+    """Return the cell formatter for a column; float rules depend only on the column name."""
+    if "%" in col_name:
+        fmt_float = lambda v: f"{v:.1f}%"
+    elif "Ratio" in col_name:
+        fmt_float = lambda v: f"{v:.2f}"
+    elif "$$" in col_name or "Limit" in col_name or "Dep" in col_name.split("/")[0]:
+        fmt_float = lambda v: f"${v:,.0f}" if abs(v) >= 100 else f"${v:.2f}"
+    elif "Avg" in col_name or "Average" in col_name or "Med" in col_name:
+        fmt_float = lambda v: f"{v:.1f}"
+    else:
+        fmt_float = lambda v: f"{v:,.0f}" if abs(v) >= 10 else f"{v:.2f}"
+
+    def fmt(val):
+        if pd.isna(val) or val == "":
+            return ""
+        if isinstance(val, (int, np.integer)):
+            return f"{val:,}"
+        if isinstance(val, (float, np.floating)):
+            return fmt_float(val)
+        return str(val)
+
+    return fmt
+
+
+# One <a:tc> per cell: centred paragraph, font size in 1/100 pt, optional bold and solid fill
+PPT_CELL_XML = (
+    '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p><a:pPr algn="ctr"><a:defRPr sz="{size}"{bold}/></a:pPr>'
+    "{run}</a:p></a:txBody><a:tcPr>{fill}</a:tcPr></a:tc>"
+)
+PPT_TOTAL_FILL = RGBColor(240, 240, 240)
+
+
+def ppt_row_xml(texts, height, size, bold=False, fill=None):
+    """Render one table row as an <a:tr> XML string."""
+    bold_attr = ' b="1"' if bold else ""
+    fill_xml = f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>' if fill is not None else ""
+    cells = "".join(
+        PPT_CELL_XML.format(
+            size=size, bold=bold_attr, fill=fill_xml,
+            run=f"<a:r><a:t>{escape(text)}</a:t></a:r>" if text else "",
+        )
+        for text in texts
+    )
+    return f'<a:tr h="{height}">{cells}</a:tr>'
+
+
 def format_ppt_table(table, data, header_fill=RGBColor(204, 229, 255)):
-    """Apply formatting to a PowerPoint table."""
-    rows, cols = data.shape
+    """Apply formatting to a PowerPoint table.
+
+    The whole <a:tbl> is rendered as one XML string (add_table's tblPr/tblGrid plus
+    the formatted rows), parsed in one call and swapped into the graphicFrame in place
+    of the placeholder table, instead of setting text/font/fill per cell.
+    """
+    tbl = table._tbl
+    row_hs = [tr.get("h") for tr in tbl.tr_lst]  # add_table gives the last row the rounding remainder
 
     # Header row
-    for col_idx, col_name in enumerate(data.columns):
-        cell = table.cell(0, col_idx)
-        cell.text = str(col_name)
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = header_fill
-        p = cell.text_frame.paragraphs[0]
-        p.font.bold = True
-        p.font.size = Pt(9)
-        p.alignment = PP_ALIGN.CENTER
-
-    # Data rows
-    for r_idx, (_, row) in enumerate(data.iterrows()):
-        for c_idx, col_name in enumerate(data.columns):
-            cell = table.cell(r_idx + 1, c_idx)
-            val = row[col_name]
-
-            # Format value
-            if pd.isna(val) or val == "":
-                cell.text = ""
-            elif isinstance(val, (int, np.integer)):
-                cell.text = f"{val:,}"
-            elif isinstance(val, (float, np.floating)):
-                if "%" in col_name:
-                    cell.text = f"{val:.1f}%"
-                elif "Ratio" in col_name:
-                    cell.text = f"{val:.2f}"
-                elif "$$" in col_name or "Limit" in col_name or "Dep" in col_name.split("/")[0]:
-                    cell.text = f"${val:,.0f}" if abs(val) >= 100 else f"${val:.2f}"
-                elif "Avg" in col_name or "Average" in col_name or "Med" in col_name:
-                    cell.text = f"{val:.1f}"
-                else:
-                    cell.text = f"{val:,.0f}" if abs(val) >= 10 else f"{val:.2f}"
-            else:
-                cell.text = str(val)
-
-            p = cell.text_frame.paragraphs[0]
-            p.font.size = Pt(8)
-            p.alignment = PP_ALIGN.CENTER
-
-            # Bold Grand Total rows
-            first_val = str(row.iloc[0]).lower()
-            if "total" in first_val or "grand" in first_val:
-                p.font.bold = True
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(240, 240, 240)
+    rows_xml = [ppt_row_xml([str(c) for c in data.columns], row_hs[0], 900, bold=True, fill=str(header_fill))]
+
+    # Data rows – one formatter per column, values pulled column-wise as plain Python lists
+    fmts = [pick_fmt(str(c)) for c in data.columns]
+    col_values = [data[c].tolist() for c in data.columns]
+    for row_h, row_vals in zip(row_hs[1:], zip(*col_values)):
+        texts = [fmt(val) for val, fmt in zip(row_vals, fmts)]
+
+        # Bold Grand Total rows
+        first_val = str(row_vals[0]).lower()
+        if "total" in first_val or "grand" in first_val:
+            rows_xml.append(ppt_row_xml(texts, row_h, 800, bold=True, fill=str(PPT_TOTAL_FILL)))
+        else:
+            rows_xml.append(ppt_row_xml(texts, row_h, 800))
+
+    head_xml = "".join(etree.tostring(el, encoding="unicode") for el in (tbl.tblPr, tbl.tblGrid))
+    new_tbl = parse_xml(f"<a:tbl {nsdecls('a')}>{head_xml}{''.join(rows_xml)}</a:tbl>")
+    tbl.getparent().replace(tbl, new_tbl)
 
 
 def add_slide_with_table(prs, title, data_df):
     """Add a slide with a formatted table to the presentation."""
+    data_df = trim(data_df)
     slide = prs.slides.add_slide(prs.slide_layouts[5])
     
     # Set title with constrained size
@@ -202,21 +339,197 @@ def add_slide_with_table(prs, title, data_df):
     return slide
 
 
-def save_chart(fig, filename):
-    """Save a matplotlib figure and close it."""
-    fig.savefig(filename, dpi=200, bbox_inches="tight", facecolor="white")
+def save_chart(fig, filename, dpi=200):
+    """Save a matplotlib figure and close it.
+
+    PNG is written at a low zlib level; deflate dominates the save for large charts.
+    """
+    fig.savefig(filename, dpi=dpi, bbox_inches="tight", facecolor="white", pil_kwargs={"compress_level": 1})
     plt.close(fig)
     return filename
 
 
+# Minimal SpreadsheetML package: the workbook is a zip of these fixed parts plus one
+# xl/worksheets/sheetN.xml per tab, written directly without a cell library
+XLSX_NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+XLSX_REL_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+XLSX_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    "{sheets}</Types>"
+)
+XLSX_SHEET_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{n}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{XLSX_REL_TYPE}/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+# Cell styles (cellXfs index): 1 title, 2 heading, 3 bold label, 4 to_excel-style header
+XLSX_TITLE, XLSX_HEADING, XLSX_BOLD, XLSX_HEADER = 1, 2, 3, 4
+XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f"<styleSheet {XLSX_NS}>"
+    '<fonts count="4">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="20"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="14"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    "</fonts>"
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"><color auto="1"/></left><right style="thin"><color auto="1"/></right>'
+    '<top style="thin"><color auto="1"/></top><bottom style="thin"><color auto="1"/></bottom>'
+    "<diagonal/></border></borders>"
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="3" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="3" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" '
+    'applyAlignment="1"><alignment horizontal="center" vertical="top"/></xf>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+
+def xlsx_col(idx):
+    """Column letters for a 0-based column index (0 -> A, 26 -> AA)."""
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def xlsx_str_cell(strings, ref, text, style=0):
+    """Shared-string <c> element; the text is added to the workbook's strings table on first use."""
+    s_attr = f' s="{style}"' if style else ""
+    idx = strings.setdefault(str(text), len(strings))
+    return f'<c r="{ref}"{s_attr} t="s"><v>{idx}</v></c>'
+
+
+def xlsx_sheet_chunks(rows, cols_xml=""):
+    """Yield a complete worksheet part piece by piece: preamble, one <row> per row, closing tags."""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f"<worksheet {XLSX_NS} {XLSX_REL_NS}>{cols_xml}<sheetData>"
+    )
+    for r, cells in enumerate(rows, start=1):
+        if cells:
+            yield f'<row r="{r}">{"".join(cells)}</row>'
+    yield "</sheetData></worksheet>"
+
+
+def xlsx_tab_chunks(data_df, strings):
+    """Render a DataFrame as a worksheet: styled header row, then value rows (NaN / ±inf left blank).
+
+    Columns are homogeneous, so the number/string choice is made once per column. Rows are
+    produced lazily, so only one row of XML exists at a time however long the tab is.
+    """
+    cols = data_df.columns.tolist()
+    letters = [xlsx_col(c) for c in range(len(cols))]
+
+    # Snapshot each column once as a plain Python list, then walk rows with zip –
+    # no per-row Series or DataFrame indexing
+    is_num = [pd.api.types.is_numeric_dtype(col) for _, col in data_df.items()]
+    col_values = [
+        col.to_numpy(dtype="float64", na_value=np.nan).tolist() if num else col.astype(object).tolist()
+        for num, (_, col) in zip(is_num, data_df.items())
+    ]
+
+    def rows():
+        yield [xlsx_str_cell(strings, f"{L}1", name, XLSX_HEADER) for L, name in zip(letters, cols)]
+        for r, row_vals in enumerate(zip(*col_values), start=2):
+            yield [
+                (f'<c r="{L}{r}"><v>{value:.16G}</v></c>' if math.isfinite(value) else "")  # no INF/NAN in <v>
+                if num else
+                (xlsx_str_cell(strings, f"{L}{r}", value) if pd.notna(value) else "")
+                for L, num, value in zip(letters, is_num, row_vals)
+            ]
+
+    return xlsx_sheet_chunks(rows())
+
+
+def xlsx_write_part(zf, part_name, chunks):
+    """Stream XML chunks into a new zip member without joining them into one string."""
+    with zf.open(part_name, "w") as out:
+        for chunk in chunks:
+            out.write(chunk.encode("utf-8"))
+
+
+def xlsx_workbook_parts(sheets, strings):
+    """Return (part name, XML) for the package parts that depend on the sheet list and strings."""
+    n = len(sheets)
+    sheet_els = "".join(
+        f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheets, start=1)
+    )
+    rels = "".join(
+        f'<Relationship Id="rId{i}" Type="{XLSX_REL_TYPE}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, n + 1)
+    )
+    return [
+        ("[Content_Types].xml",
+         XLSX_CONTENT_TYPES.format(sheets="".join(XLSX_SHEET_TYPE.format(n=i) for i in range(1, n + 1)))),
+        ("_rels/.rels", XLSX_ROOT_RELS),
+        ("xl/workbook.xml",
+         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+         f"<workbook {XLSX_NS} {XLSX_REL_NS}><sheets>{sheet_els}</sheets></workbook>"),
+        ("xl/_rels/workbook.xml.rels",
+         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+         f'{rels}<Relationship Id="rId{n + 1}" Type="{XLSX_REL_TYPE}/styles" Target="styles.xml"/>'
+         f'<Relationship Id="rId{n + 2}" Type="{XLSX_REL_TYPE}/sharedStrings" Target="sharedStrings.xml"/>'
+         "</Relationships>"),
+        ("xl/styles.xml", XLSX_STYLES),
+        ("xl/sharedStrings.xml",
+         '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+         f'<sst {XLSX_NS} uniqueCount="{len(strings)}">'
+         + "".join(f'<si><t xml:space="preserve">{escape(text)}</t></si>' for text in strings)
+         + "</sst>"),
+    ]
+
+
 # ═══════════════════════════════════════════════════════════════════
 # 4. RUN ALL ANALYSES
 # ═══════════════════════════════════════════════════════════════════
 
 # Common filters
 OPEN_MASK = df["Account Status"] == "O"
-PERSONAL_OPEN = OPEN_MASK & (df["Business Flag"] == "P")
-BUSINESS_OPEN = OPEN_MASK & (df["Business Flag"] == "B")
+
+# Segment key: Business Flag for open accounts ("P"/"B"), "X" for everything else.
+# Factorized once; segment masks and two-way groupbys all run on its codes.
+SEGMENT = pd.Series(
+    np.where(OPEN_MASK, df["Business Flag"].astype(str), "X"), index=df.index, name="Segment"
+).astype("category")
+PERSONAL_OPEN = SEGMENT == "P"
+BUSINESS_OPEN = SEGMENT == "B"
+
+# Segment frames are sliced once and shared read-only by every analysis below
+USED_COLS = [
+    "AcctNo", "Total Items", "Paid Items", "Deposit Count", "Deposit Amount", "OD Limit",
+    "Swipes", "OD Status", "Reg E Flag", "Open Date", "Year Opened",
+]
+df_p = df.loc[PERSONAL_OPEN, USED_COLS]
+df_b = df.loc[BUSINESS_OPEN, USED_COLS]
 
 NSF_BINS = [-1, 0, 6, 12, 24, 36, 48, float("inf")]
 NSF_LABELS = ["0", "1–6", "7–12", "13–24", "25–36", "37–48", "49+"]
@@ -228,7 +541,7 @@ chart_files = []  # Track temp chart files for cleanup
 
 # ── ANALYSIS 1: Account Status Summary (All Accounts) ──
 print("\n── Analysis 1: Account Status Summary ──")
-stat_code_summary = df.groupby("Account Status").agg(
+stat_code_summary = df.groupby("Account Status", observed=True).agg(
     **{
         "# of Accounts": ("AcctNo", "count"),
         "# of Items": ("Total Items", "sum"),
@@ -236,24 +549,20 @@ stat_code_summary = df.groupby("Account Status").agg(
     }
 ).reset_index()
 
-stat_code_summary["% of Accounts"] = (stat_code_summary["# of Accounts"] / stat_code_summary["# of Accounts"].sum() * 100).round(2)
-stat_code_summary["% of Items"] = (stat_code_summary["# of Items"] / stat_code_summary["# of Items"].sum() * 100).round(2)
-stat_code_summary["Pay Ratio"] = np.where(
-    stat_code_summary["# of Items"] > 0,
-    (stat_code_summary["# of Items Paid"] / stat_code_summary["# of Items"]).round(2), 0
-)
+stat_code_summary["% of Accounts"] = pct_of_total(stat_code_summary["# of Accounts"])
+stat_code_summary["% of Items"] = pct_of_total(stat_code_summary["# of Items"])
+stat_code_summary["Pay Ratio"] = pay_ratio(stat_code_summary["# of Items Paid"], stat_code_summary["# of Items"])
 
 # Grand Total
 ti = stat_code_summary["# of Items"].sum()
 tp = stat_code_summary["# of Items Paid"].sum()
-gt = pd.DataFrame([{
+append_totals(stat_code_summary, {
     "Account Status": "Grand Total",
     "# of Accounts": stat_code_summary["# of Accounts"].sum(),
     "# of Items": ti, "# of Items Paid": tp,
     "% of Accounts": 100.0, "% of Items": 100.0,
     "Pay Ratio": round(tp / ti, 2) if ti > 0 else 0,
-}])
-stat_code_summary = pd.concat([stat_code_summary, gt], ignore_index=True)
+})
 stat_code_summary = stat_code_summary[["Account Status", "# of Accounts", "% of Accounts", "# of Items", "% of Items", "# of Items Paid", "Pay Ratio"]]
 print(f"  {stat_code_summary.shape[0]} rows")
 
@@ -261,7 +570,7 @@ print(f"  {stat_code_summary.shape[0]} rows")
 print("── Analysis 2: Account Type (Open Accounts) ──")
 df_open = df[OPEN_MASK].copy()
 
-acct_type_summary = df_open.groupby("Business Flag").agg(
+acct_type_summary = df_open.groupby("Business Flag", observed=True).agg(
     **{
         "# of Accounts": ("AcctNo", "count"),
         "# of Items": ("Total Items", "sum"),
@@ -269,205 +578,173 @@ acct_type_summary = df_open.groupby("Business Flag").agg(
     }
 ).reset_index()
 
-acct_type_summary["% of Accounts"] = (acct_type_summary["# of Accounts"] / acct_type_summary["# of Accounts"].sum() * 100).round(2)
-acct_type_summary["% of Items"] = (acct_type_summary["# of Items"] / acct_type_summary["# of Items"].sum() * 100).round(2)
-acct_type_summary["Pay Ratio"] = np.where(
-    acct_type_summary["# of Items"] > 0,
-    (acct_type_summary["# of Paid Items"] / acct_type_summary["# of Items"]).round(2), 0
-)
+acct_type_summary["% of Accounts"] = pct_of_total(acct_type_summary["# of Accounts"])
+acct_type_summary["% of Items"] = pct_of_total(acct_type_summary["# of Items"])
+acct_type_summary["Pay Ratio"] = pay_ratio(acct_type_summary["# of Paid Items"], acct_type_summary["# of Items"])
 acct_type_summary["Business Flag"] = acct_type_summary["Business Flag"].map({"P": "Personal", "B": "Business"}).fillna(acct_type_summary["Business Flag"])
 
 # Grand Total
 ti2 = acct_type_summary["# of Items"].sum()
 tp2 = acct_type_summary["# of Paid Items"].sum()
-gt2 = pd.DataFrame([{
+append_totals(acct_type_summary, {
     "Business Flag": "Grand Total",
     "# of Accounts": acct_type_summary["# of Accounts"].sum(),
     "# of Items": ti2, "# of Paid Items": tp2,
     "% of Accounts": 100.0, "% of Items": 100.0,
     "Pay Ratio": round(tp2 / ti2, 2) if ti2 > 0 else 0,
-}])
-acct_type_summary = pd.concat([acct_type_summary, gt2], ignore_index=True)
+})
 print(f"  {acct_type_summary.shape[0]} rows")
 
 
 # ── ANALYSIS 3: Personal Deposit Distribution ──
 print("── Analysis 3: Personal Deposit Distribution ──")
-personal_df = df[PERSONAL_OPEN].copy()
-personal_df["Deposit Bin"] = pd.cut(personal_df["Deposit Count"], bins=DEP_BINS, labels=DEP_LABELS)
+dep_bins_p = pd.cut(df_p["Deposit Count"], bins=DEP_BINS, labels=DEP_LABELS).rename("Deposit Bin")
 
-personal_deposit_summary = personal_df.groupby("Deposit Bin", observed=True).agg(
+personal_deposit_summary = df_p.groupby(dep_bins_p, observed=True).agg(
     Accounts=("AcctNo", "count"),
     **{"Avg $$ Deposits": ("Deposit Amount", "mean")},
     **{"Avg # Deposits": ("Deposit Count", "mean")},
 ).reset_index()
-personal_deposit_summary["% of Accounts"] = (personal_deposit_summary["Accounts"] / personal_deposit_summary["Accounts"].sum() * 100).round(2)
+personal_deposit_summary["% of Accounts"] = pct_of_total(personal_deposit_summary["Accounts"])
 personal_deposit_summary.rename(columns={"Deposit Bin": "Deposit Bin"}, inplace=True)
 
 # Grand Total
-gt3 = pd.DataFrame([{
+append_totals(personal_deposit_summary, {
     "Deposit Bin": "Grand Total",
     "Accounts": personal_deposit_summary["Accounts"].sum(),
-    "Avg $$ Deposits": personal_df["Deposit Amount"].mean(),
-    "Avg # Deposits": personal_df["Deposit Count"].mean(),
+    "Avg $$ Deposits": df_p["Deposit Amount"].mean(),
+    "Avg # Deposits": df_p["Deposit Count"].mean(),
     "% of Accounts": 100.0,
-}])
-personal_deposit_summary = pd.concat([personal_deposit_summary, gt3], ignore_index=True)
+})
 print(f"  {personal_deposit_summary.shape[0]} rows")
 
 
 # ── ANALYSIS 4: Business Deposit Distribution ──
 print("── Analysis 4: Business Deposit Distribution ──")
-business_df = df[BUSINESS_OPEN].copy()
-business_df["Deposit Bin"] = pd.cut(business_df["Deposit Count"], bins=DEP_BINS, labels=DEP_LABELS)
+dep_bins_b = pd.cut(df_b["Deposit Count"], bins=DEP_BINS, labels=DEP_LABELS).rename("Deposit Bin")
 
-business_deposit_summary = business_df.groupby("Deposit Bin", observed=True).agg(
+business_deposit_summary = df_b.groupby(dep_bins_b, observed=True).agg(
     Accounts=("AcctNo", "count"),
     **{"Avg $$ Deposits": ("Deposit Amount", "mean")},
     **{"Avg # Deposits": ("Deposit Count", "mean")},
 ).reset_index()
-business_deposit_summary["% of Accounts"] = (business_deposit_summary["Accounts"] / business_deposit_summary["Accounts"].sum() * 100).round(2)
+business_deposit_summary["% of Accounts"] = pct_of_total(business_deposit_summary["Accounts"])
 
-gt4 = pd.DataFrame([{
+append_totals(business_deposit_summary, {
     "Deposit Bin": "Grand Total",
     "Accounts": business_deposit_summary["Accounts"].sum(),
-    "Avg $$ Deposits": business_df["Deposit Amount"].mean(),
-    "Avg # Deposits": business_df["Deposit Count"].mean(),
+    "Avg $$ Deposits": df_b["Deposit Amount"].mean(),
+    "Avg # Deposits": df_b["Deposit Count"].mean(),
     "% of Accounts": 100.0,
-}])
-business_deposit_summary = pd.concat([business_deposit_summary, gt4], ignore_index=True)
+})
 print(f"  {business_deposit_summary.shape[0]} rows")
 
 
+# ── NSF Bin aggregates (shared by Analyses 5–10) ──
+# One two-way (segment × bin) groupby pass; each analysis selects the columns it reports.
+NSF_AGG = {
+    "# of Accounts": ("AcctNo", "count"),
+    "Total OD/NSF Items": ("Total Items", "sum"),
+    "# of Items Paid": ("Paid Items", "sum"),
+    "Avg # Dep/Month": ("Deposit Count", "mean"),
+    "Avg $$ Dep/Month": ("Deposit Amount", "mean"),
+    "Average of OD Limit": ("OD Limit", "mean"),
+    "Average of Swipes": ("Swipes", "mean"),
+}
+nsf_bin = pd.Series(bin_codes(df["Total Items"], NSF_BINS, NSF_LABELS), index=df.index, name="NSF Bin")
+nsf_agg = df.groupby([SEGMENT, nsf_bin], observed=True).agg(**NSF_AGG)
+
+nsf_seg = nsf_agg.index.get_level_values("Segment")
+agg_p = nsf_agg[nsf_seg == "P"].droplevel("Segment").reset_index()
+agg_b = nsf_agg[nsf_seg == "B"].droplevel("Segment").reset_index()
+
+
 # ── ANALYSIS 5: Personal NSF Stratification (Volume) ──
 print("── Analysis 5: Personal NSF Stratification ──")
-personal_nsf = df[PERSONAL_OPEN].copy()
-personal_nsf["NSF Bin"] = pd.cut(personal_nsf["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_strat1 = personal_nsf.groupby("NSF Bin", observed=True).agg(
-    **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum")}
-).reset_index()
-nsf_strat1["NSF Bin"] = nsf_strat1["NSF Bin"].astype(str)
+nsf_strat1 = agg_p[["NSF Bin", "# of Accounts", "Total OD/NSF Items"]].copy()
 
 ta5 = nsf_strat1["# of Accounts"].sum()
 ti5 = nsf_strat1["Total OD/NSF Items"].sum()
-nsf_strat1["% of Accounts"] = (nsf_strat1["# of Accounts"] / ta5 * 100).round(2)
-nsf_strat1["% of Items Presented"] = (nsf_strat1["Total OD/NSF Items"] / ti5 * 100).round(2) if ti5 > 0 else 0
+nsf_strat1["% of Accounts"] = pct_of_total(nsf_strat1["# of Accounts"], ta5)
+nsf_strat1["% of Items Presented"] = pct_of_total(nsf_strat1["Total OD/NSF Items"], ti5)
 
-gt5 = pd.DataFrame([{"NSF Bin": "Grand Total", "# of Accounts": ta5, "% of Accounts": 100.0, "Total OD/NSF Items": ti5, "% of Items Presented": 100.0}])
-nsf_strat1 = pd.concat([nsf_strat1, gt5], ignore_index=True)
+append_totals(nsf_strat1, {"NSF Bin": "Grand Total", "# of Accounts": ta5, "% of Accounts": 100.0, "Total OD/NSF Items": ti5, "% of Items Presented": 100.0})
 nsf_strat1 = nsf_strat1[["NSF Bin", "# of Accounts", "% of Accounts", "Total OD/NSF Items", "% of Items Presented"]]
 print(f"  {nsf_strat1.shape[0]} rows")
 
 
 # ── ANALYSIS 6: Business NSF Stratification (Volume) ──
 print("── Analysis 6: Business NSF Stratification ──")
-business_nsf = df[BUSINESS_OPEN].copy()
-business_nsf["NSF Bin"] = pd.cut(business_nsf["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_strat_biz = business_nsf.groupby("NSF Bin", observed=True).agg(
-    **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum")}
-).reset_index()
-nsf_strat_biz["NSF Bin"] = nsf_strat_biz["NSF Bin"].astype(str)
+nsf_strat_biz = agg_b[["NSF Bin", "# of Accounts", "Total OD/NSF Items"]].copy()
 
 ta6 = nsf_strat_biz["# of Accounts"].sum()
 ti6 = nsf_strat_biz["Total OD/NSF Items"].sum()
-nsf_strat_biz["% of Accounts"] = (nsf_strat_biz["# of Accounts"] / ta6 * 100).round(2)
-nsf_strat_biz["% of Items Presented"] = (nsf_strat_biz["Total OD/NSF Items"] / ti6 * 100).round(2) if ti6 > 0 else 0
+nsf_strat_biz["% of Accounts"] = pct_of_total(nsf_strat_biz["# of Accounts"], ta6)
+nsf_strat_biz["% of Items Presented"] = pct_of_total(nsf_strat_biz["Total OD/NSF Items"], ti6)
 
-gt6 = pd.DataFrame([{"NSF Bin": "Grand Total", "# of Accounts": ta6, "% of Accounts": 100.0, "Total OD/NSF Items": ti6, "% of Items Presented": 100.0}])
-nsf_strat_biz = pd.concat([nsf_strat_biz, gt6], ignore_index=True)
+append_totals(nsf_strat_biz, {"NSF Bin": "Grand Total", "# of Accounts": ta6, "% of Accounts": 100.0, "Total OD/NSF Items": ti6, "% of Items Presented": 100.0})
 nsf_strat_biz = nsf_strat_biz[["NSF Bin", "# of Accounts", "% of Accounts", "Total OD/NSF Items", "% of Items Presented"]]
 print(f"  {nsf_strat_biz.shape[0]} rows")
 
 
 # ── ANALYSIS 7: Personal NSF + Pay Ratio ──
 print("── Analysis 7: Personal NSF + Pay Ratio ──")
-nsf_strat_personal_pay = df[PERSONAL_OPEN].copy()
-nsf_strat_personal_pay["NSF Bin"] = pd.cut(nsf_strat_personal_pay["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_pay_p = nsf_strat_personal_pay.groupby("NSF Bin", observed=True).agg(
-    **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum"), "# of Items Paid": ("Paid Items", "sum")}
-).reset_index()
-nsf_pay_p["NSF Bin"] = nsf_pay_p["NSF Bin"].astype(str)
+nsf_pay_p = agg_p[["NSF Bin", "# of Accounts", "Total OD/NSF Items", "# of Items Paid"]].copy()
 
 ta7 = nsf_pay_p["# of Accounts"].sum()
 ti7 = nsf_pay_p["Total OD/NSF Items"].sum()
 tp7 = nsf_pay_p["# of Items Paid"].sum()
-nsf_pay_p["% of Accounts"] = (nsf_pay_p["# of Accounts"] / ta7 * 100).round(2)
-nsf_pay_p["% of Items Presented"] = (nsf_pay_p["Total OD/NSF Items"] / ti7 * 100).round(2) if ti7 > 0 else 0
-nsf_pay_p["% Pay Rate"] = np.where(nsf_pay_p["Total OD/NSF Items"] > 0, (nsf_pay_p["# of Items Paid"] / nsf_pay_p["Total OD/NSF Items"] * 100).round(1), 0)
+nsf_pay_p["% of Accounts"] = pct_of_total(nsf_pay_p["# of Accounts"], ta7)
+nsf_pay_p["% of Items Presented"] = pct_of_total(nsf_pay_p["Total OD/NSF Items"], ti7)
+nsf_pay_p["% Pay Rate"] = pay_ratio(nsf_pay_p["# of Items Paid"], nsf_pay_p["Total OD/NSF Items"], scale=100, decimals=1)
 
-gt7 = pd.DataFrame([{
+append_totals(nsf_pay_p, {
     "NSF Bin": "Grand Total", "# of Accounts": ta7, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti7, "% of Items Presented": 100.0,
     "# of Items Paid": tp7, "% Pay Rate": round(tp7 / ti7 * 100, 1) if ti7 > 0 else 0,
-}])
-nsf_pay_p = pd.concat([nsf_pay_p, gt7], ignore_index=True)
+})
 print(f"  {nsf_pay_p.shape[0]} rows")
 
 
 # ── ANALYSIS 8: Business NSF + Pay Ratio ──
 print("── Analysis 8: Business NSF + Pay Ratio ──")
-nsf_strat_business_pay = df[BUSINESS_OPEN].copy()
-nsf_strat_business_pay["NSF Bin"] = pd.cut(nsf_strat_business_pay["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_pay_b = nsf_strat_business_pay.groupby("NSF Bin", observed=True).agg(
-    **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum"), "# of Items Paid": ("Paid Items", "sum")}
-).reset_index()
-nsf_pay_b["NSF Bin"] = nsf_pay_b["NSF Bin"].astype(str)
+nsf_pay_b = agg_b[["NSF Bin", "# of Accounts", "Total OD/NSF Items", "# of Items Paid"]].copy()
 
 ta8 = nsf_pay_b["# of Accounts"].sum()
 ti8 = nsf_pay_b["Total OD/NSF Items"].sum()
 tp8 = nsf_pay_b["# of Items Paid"].sum()
-nsf_pay_b["% of Accounts"] = (nsf_pay_b["# of Accounts"] / ta8 * 100).round(2)
-nsf_pay_b["% of Items Presented"] = (nsf_pay_b["Total OD/NSF Items"] / ti8 * 100).round(2) if ti8 > 0 else 0
-nsf_pay_b["% Pay Rate"] = np.where(nsf_pay_b["Total OD/NSF Items"] > 0, (nsf_pay_b["# of Items Paid"] / nsf_pay_b["Total OD/NSF Items"] * 100).round(1), 0)
+nsf_pay_b["% of Accounts"] = pct_of_total(nsf_pay_b["# of Accounts"], ta8)
+nsf_pay_b["% of Items Presented"] = pct_of_total(nsf_pay_b["Total OD/NSF Items"], ti8)
+nsf_pay_b["% Pay Rate"] = pay_ratio(nsf_pay_b["# of Items Paid"], nsf_pay_b["Total OD/NSF Items"], scale=100, decimals=1)
 
-gt8 = pd.DataFrame([{
+append_totals(nsf_pay_b, {
     "NSF Bin": "Grand Total", "# of Accounts": ta8, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti8, "% of Items Presented": 100.0,
     "# of Items Paid": tp8, "% Pay Rate": round(tp8 / ti8 * 100, 1) if ti8 > 0 else 0,
-}])
-nsf_pay_b = pd.concat([nsf_pay_b, gt8], ignore_index=True)
+})
 print(f"  {nsf_pay_b.shape[0]} rows")
 
 
 # ── ANALYSIS 9: Personal NSF + Deposits + Swipes ──
 print("── Analysis 9: Personal NSF + Deposits + Swipes ──")
-p9 = df[PERSONAL_OPEN].copy()
-p9["NSF Bin"] = pd.cut(p9["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_deps_p = p9.groupby("NSF Bin", observed=True).agg(
-    **{
-        "# of Accounts": ("AcctNo", "count"),
-        "Total OD/NSF Items": ("Total Items", "sum"),
-        "# of Items Paid": ("Paid Items", "sum"),
-        "Avg # Dep/Month": ("Deposit Count", "mean"),
-        "Avg $$ Dep/Month": ("Deposit Amount", "mean"),
-        "Average of OD Limit": ("OD Limit", "mean"),
-        "Average of Swipes": ("Swipes", "mean"),
-    }
-).reset_index()
-nsf_deps_p["NSF Bin"] = nsf_deps_p["NSF Bin"].astype(str)
+nsf_deps_p = agg_p.copy()
 
 ta9 = nsf_deps_p["# of Accounts"].sum()
 ti9 = nsf_deps_p["Total OD/NSF Items"].sum()
 tp9 = nsf_deps_p["# of Items Paid"].sum()
-nsf_deps_p["% of Accounts"] = (nsf_deps_p["# of Accounts"] / ta9 * 100).round(2)
-nsf_deps_p["% of Items Presented"] = (nsf_deps_p["Total OD/NSF Items"] / ti9 * 100).round(2) if ti9 > 0 else 0
-nsf_deps_p["% Pay Rate"] = np.where(nsf_deps_p["Total OD/NSF Items"] > 0, (nsf_deps_p["# of Items Paid"] / nsf_deps_p["Total OD/NSF Items"] * 100).round(1), 0)
+nsf_deps_p["% of Accounts"] = pct_of_total(nsf_deps_p["# of Accounts"], ta9)
+nsf_deps_p["% of Items Presented"] = pct_of_total(nsf_deps_p["Total OD/NSF Items"], ti9)
+nsf_deps_p["% Pay Rate"] = pay_ratio(nsf_deps_p["# of Items Paid"], nsf_deps_p["Total OD/NSF Items"], scale=100, decimals=1)
 
-gt9 = pd.DataFrame([{
+append_totals(nsf_deps_p, {
     "NSF Bin": "Grand Total", "# of Accounts": ta9, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti9, "% of Items Presented": 100.0,
     "# of Items Paid": tp9, "% Pay Rate": round(tp9 / ti9 * 100, 1) if ti9 > 0 else 0,
-    "Avg # Dep/Month": p9["Deposit Count"].mean(),
-    "Avg $$ Dep/Month": p9["Deposit Amount"].mean(),
-    "Average of OD Limit": p9["OD Limit"].mean(),
-    "Average of Swipes": p9["Swipes"].mean(),
-}])
-nsf_deps_p = pd.concat([nsf_deps_p, gt9], ignore_index=True)
+    "Avg # Dep/Month": df_p["Deposit Count"].mean(),
+    "Avg $$ Dep/Month": df_p["Deposit Amount"].mean(),
+    "Average of OD Limit": df_p["OD Limit"].mean(),
+    "Average of Swipes": df_p["Swipes"].mean(),
+})
 for col in ["Avg # Dep/Month", "Avg $$ Dep/Month", "Average of OD Limit", "Average of Swipes"]:
     nsf_deps_p[col] = nsf_deps_p[col].round(2)
 print(f"  {nsf_deps_p.shape[0]} rows")
@@ -475,112 +752,94 @@ print(f"  {nsf_deps_p.shape[0]} rows")
 
 # ── ANALYSIS 10: Business NSF + Deposits + Swipes ──
 print("── Analysis 10: Business NSF + Deposits + Swipes ──")
-b10 = df[BUSINESS_OPEN].copy()
-b10["NSF Bin"] = pd.cut(b10["Total Items"], bins=NSF_BINS, labels=NSF_LABELS)
-
-nsf_deps_b = b10.groupby("NSF Bin", observed=True).agg(
-    **{
-        "# of Accounts": ("AcctNo", "count"),
-        "Total OD/NSF Items": ("Total Items", "sum"),
-        "# of Items Paid": ("Paid Items", "sum"),
-        "Avg # Dep/Month": ("Deposit Count", "mean"),
-        "Avg $$ Dep/Month": ("Deposit Amount", "mean"),
-        "Average of OD Limit": ("OD Limit", "mean"),
-        "Average of Swipes": ("Swipes", "mean"),
-    }
-).reset_index()
-nsf_deps_b["NSF Bin"] = nsf_deps_b["NSF Bin"].astype(str)
+nsf_deps_b = agg_b.copy()
 
 ta10 = nsf_deps_b["# of Accounts"].sum()
 ti10 = nsf_deps_b["Total OD/NSF Items"].sum()
 tp10 = nsf_deps_b["# of Items Paid"].sum()
-nsf_deps_b["% of Accounts"] = (nsf_deps_b["# of Accounts"] / ta10 * 100).round(2)
-nsf_deps_b["% of Items Presented"] = (nsf_deps_b["Total OD/NSF Items"] / ti10 * 100).round(2) if ti10 > 0 else 0
-nsf_deps_b["% Pay Rate"] = np.where(nsf_deps_b["Total OD/NSF Items"] > 0, (nsf_deps_b["# of Items Paid"] / nsf_deps_b["Total OD/NSF Items"] * 100).round(1), 0)
+nsf_deps_b["% of Accounts"] = pct_of_total(nsf_deps_b["# of Accounts"], ta10)
+nsf_deps_b["% of Items Presented"] = pct_of_total(nsf_deps_b["Total OD/NSF Items"], ti10)
+nsf_deps_b["% Pay Rate"] = pay_ratio(nsf_deps_b["# of Items Paid"], nsf_deps_b["Total OD/NSF Items"], scale=100, decimals=1)
 
-gt10 = pd.DataFrame([{
+append_totals(nsf_deps_b, {
     "NSF Bin": "Grand Total", "# of Accounts": ta10, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti10, "% of Items Presented": 100.0,
     "# of Items Paid": tp10, "% Pay Rate": round(tp10 / ti10 * 100, 1) if ti10 > 0 else 0,
-    "Avg # Dep/Month": b10["Deposit Count"].mean(),
-    "Avg $$ Dep/Month": b10["Deposit Amount"].mean(),
-    "Average of OD Limit": b10["OD Limit"].mean(),
-    "Average of Swipes": b10["Swipes"].mean(),
-}])
-nsf_deps_b = pd.concat([nsf_deps_b, gt10], ignore_index=True)
+    "Avg # Dep/Month": df_b["Deposit Count"].mean(),
+    "Avg $$ Dep/Month": df_b["Deposit Amount"].mean(),
+    "Average of OD Limit": df_b["OD Limit"].mean(),
+    "Average of Swipes": df_b["Swipes"].mean(),
+})
 for col in ["Avg # Dep/Month", "Avg $$ Dep/Month", "Average of OD Limit", "Average of Swipes"]:
     nsf_deps_b[col] = nsf_deps_b[col].round(2)
 print(f"  {nsf_deps_b.shape[0]} rows")
 
 
+# ── Segment groupbys (shared by Analyses 11–14) ──
+# Group index is factorized once per (segment, key) and reused by any aggregation on it.
+gb_p_od = df_p.groupby("OD Status", observed=True)
+gb_b_od = df_b.groupby("OD Status", observed=True)
+gb_p_rege = df_p.groupby("Reg E Flag", observed=True)
+gb_p_odlim = df_p.groupby("OD Limit", observed=True)
+
+
 # ── ANALYSIS 11: Personal OD Status Stratification ──
 print("── Analysis 11: Personal OD Status Stratification ──")
-p_od = df[PERSONAL_OPEN].copy()
-
-od_status_personal = p_od.groupby("OD Status").agg(
+od_status_personal = gb_p_od.agg(
     **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum"), "# of Items Paid": ("Paid Items", "sum")}
 ).reset_index()
-od_status_personal["OD Status"] = od_status_personal["OD Status"].astype(str)
+od_status_personal["OD Status"] = od_status_personal["OD Status"].cat.rename_categories(str)
 
 ta11 = od_status_personal["# of Accounts"].sum()
 ti11 = od_status_personal["Total OD/NSF Items"].sum()
 tp11 = od_status_personal["# of Items Paid"].sum()
-od_status_personal["% of Accounts"] = (od_status_personal["# of Accounts"] / ta11 * 100).round(2)
-od_status_personal["% of Items Presented"] = np.where(ti11 > 0, (od_status_personal["Total OD/NSF Items"] / ti11 * 100).round(2), 0)
-od_status_personal["Pay Ratio"] = np.where(od_status_personal["Total OD/NSF Items"] > 0, (od_status_personal["# of Items Paid"] / od_status_personal["Total OD/NSF Items"]).round(4), 0)
+od_status_personal["% of Accounts"] = pct_of_total(od_status_personal["# of Accounts"], ta11)
+od_status_personal["% of Items Presented"] = pct_of_total(od_status_personal["Total OD/NSF Items"], ti11)
+od_status_personal["Pay Ratio"] = pay_ratio(od_status_personal["# of Items Paid"], od_status_personal["Total OD/NSF Items"], decimals=4)
 
-gt11 = pd.DataFrame([{
+append_totals(od_status_personal, {
     "OD Status": "Grand Total", "# of Accounts": ta11, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti11, "% of Items Presented": 100.0,
     "# of Items Paid": tp11, "Pay Ratio": round(tp11 / ti11, 4) if ti11 > 0 else 0,
-}])
-od_status_personal = pd.concat([od_status_personal, gt11], ignore_index=True)
+})
 print(f"  {od_status_personal.shape[0]} rows")
 
 
 # ── ANALYSIS 12: Business OD Status Stratification ──
 print("── Analysis 12: Business OD Status Stratification ──")
-b_od = df[BUSINESS_OPEN].copy()
-
-od_status_business = b_od.groupby("OD Status").agg(
+od_status_business = gb_b_od.agg(
     **{"# of Accounts": ("AcctNo", "count"), "Total OD/NSF Items": ("Total Items", "sum"), "# of Items Paid": ("Paid Items", "sum")}
 ).reset_index()
-od_status_business["OD Status"] = od_status_business["OD Status"].astype(str)
+od_status_business["OD Status"] = od_status_business["OD Status"].cat.rename_categories(str)
 
 ta12 = od_status_business["# of Accounts"].sum()
 ti12 = od_status_business["Total OD/NSF Items"].sum()
 tp12 = od_status_business["# of Items Paid"].sum()
-od_status_business["% of Accounts"] = (od_status_business["# of Accounts"] / ta12 * 100).round(2)
-od_status_business["% of Items Presented"] = np.where(ti12 > 0, (od_status_business["Total OD/NSF Items"] / ti12 * 100).round(2), 0)
-od_status_business["Pay Ratio"] = np.where(od_status_business["Total OD/NSF Items"] > 0, (od_status_business["# of Items Paid"] / od_status_business["Total OD/NSF Items"]).round(4), 0)
+od_status_business["% of Accounts"] = pct_of_total(od_status_business["# of Accounts"], ta12)
+od_status_business["% of Items Presented"] = pct_of_total(od_status_business["Total OD/NSF Items"], ti12)
+od_status_business["Pay Ratio"] = pay_ratio(od_status_business["# of Items Paid"], od_status_business["Total OD/NSF Items"], decimals=4)
 
-gt12 = pd.DataFrame([{
+append_totals(od_status_business, {
     "OD Status": "Grand Total", "# of Accounts": ta12, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti12, "% of Items Presented": 100.0,
     "# of Items Paid": tp12, "Pay Ratio": round(tp12 / ti12, 4) if ti12 > 0 else 0,
-}])
-od_status_business = pd.concat([od_status_business, gt12], ignore_index=True)
+})
 print(f"  {od_status_business.shape[0]} rows")
 
 
 # ── ANALYSIS 13: Reg E Summary (Personal) ──
 print("── Analysis 13: Reg E Summary ──")
-p_rege = df[PERSONAL_OPEN].copy()
-
-reg_e_summary = p_rege.groupby("Reg E Flag").agg(**{"# of Accounts": ("AcctNo", "count")}).reset_index()
+reg_e_summary = gb_p_rege.agg(**{"# of Accounts": ("AcctNo", "count")}).reset_index()
 ta13 = reg_e_summary["# of Accounts"].sum()
-reg_e_summary["% of Accounts"] = (reg_e_summary["# of Accounts"] / ta13 * 100).round(2)
+reg_e_summary["% of Accounts"] = pct_of_total(reg_e_summary["# of Accounts"], ta13)
 
-gt13 = pd.DataFrame([{"Reg E Flag": "Grand Total", "# of Accounts": ta13, "% of Accounts": 100.0}])
-reg_e_summary = pd.concat([reg_e_summary, gt13], ignore_index=True)
+append_totals(reg_e_summary, {"Reg E Flag": "Grand Total", "# of Accounts": ta13, "% of Accounts": 100.0})
 print(f"  Reg E values: {reg_e_summary[reg_e_summary['Reg E Flag'] != 'Grand Total']['Reg E Flag'].tolist()}")
 
 
 # ── ANALYSIS 14: OD Limit Stratification (Personal) ──
 print("── Analysis 14: OD Limit Stratification ──")
-p_odl = df[PERSONAL_OPEN].copy()
-
-od_limit_summary = p_odl.groupby("OD Limit").agg(
+od_limit_summary = gb_p_odlim.agg(
     **{
         "# of Accounts": ("AcctNo", "count"),
         "Total OD/NSF Items": ("Total Items", "sum"),
@@ -595,38 +854,36 @@ od_limit_summary["OD Limit"] = od_limit_summary["OD Limit"].astype(int).astype(s
 ta14 = od_limit_summary["# of Accounts"].sum()
 ti14 = od_limit_summary["Total OD/NSF Items"].sum()
 tp14 = od_limit_summary["# of Items Paid"].sum()
-od_limit_summary["% of Accounts"] = (od_limit_summary["# of Accounts"] / ta14 * 100).round(2)
-od_limit_summary["% of Items"] = np.where(ti14 > 0, (od_limit_summary["Total OD/NSF Items"] / ti14 * 100).round(2), 0)
-od_limit_summary["Pay Ratio"] = np.where(od_limit_summary["Total OD/NSF Items"] > 0, (od_limit_summary["# of Items Paid"] / od_limit_summary["Total OD/NSF Items"]).round(4), 0)
+od_limit_summary["% of Accounts"] = pct_of_total(od_limit_summary["# of Accounts"], ta14)
+od_limit_summary["% of Items"] = pct_of_total(od_limit_summary["Total OD/NSF Items"], ti14)
+od_limit_summary["Pay Ratio"] = pay_ratio(od_limit_summary["# of Items Paid"], od_limit_summary["Total OD/NSF Items"], decimals=4)
 
-gt14 = pd.DataFrame([{
+append_totals(od_limit_summary, {
     "OD Limit": "Grand Total", "# of Accounts": ta14, "% of Accounts": 100.0,
     "Total OD/NSF Items": ti14, "% of Items": 100.0,
     "# of Items Paid": tp14, "Pay Ratio": round(tp14 / ti14, 4) if ti14 > 0 else 0,
-    "Avg # Dep/Month": p_odl["Deposit Count"].mean(),
-    "Avg $$ Dep/Month": p_odl["Deposit Amount"].mean(),
-    "Average of Swipes": p_odl["Swipes"].mean(),
-}])
-od_limit_summary = pd.concat([od_limit_summary, gt14], ignore_index=True)
+    "Avg # Dep/Month": df_p["Deposit Count"].mean(),
+    "Avg $$ Dep/Month": df_p["Deposit Amount"].mean(),
+    "Average of Swipes": df_p["Swipes"].mean(),
+})
 od_limit_summary = od_limit_summary[["OD Limit", "# of Accounts", "% of Accounts", "Total OD/NSF Items", "% of Items", "# of Items Paid", "Pay Ratio", "Avg # Dep/Month", "Avg $$ Dep/Month", "Average of Swipes"]]
 print(f"  {od_limit_summary.shape[0]} rows")
 
 
 # ── ANALYSIS 15: Historical Reg E by Year Opened ──
 print("── Analysis 15: Historical Reg E by Year Opened ──")
-p_hist = df[PERSONAL_OPEN].copy()
-p_hist = p_hist[p_hist["Open Date"].notna()].copy()
-
-def assign_year_bin(year):
-    if pd.isna(year): return "Unknown"
-    y = int(year)
-    if y < 2010: return "<2010"
-    if y <= 2025: return str(y)
-    return "2025+"
-
-p_hist["Year Bin"] = p_hist["Year Opened"].apply(assign_year_bin)
+p_hist = df_p[df_p["Open Date"].notna()].copy()
+
+# <2010, one bin per year 2010–2025, then 2025+; missing years fall to Unknown
+YEAR_BINS = [-np.inf] + list(range(2009, 2026)) + [np.inf]
+YEAR_LABELS = ["<2010"] + [str(y) for y in range(2010, 2026)] + ["2025+"]
+p_hist["Year Bin"] = (
+    pd.cut(p_hist["Year Opened"], bins=YEAR_BINS, labels=YEAR_LABELS)
+    .cat.add_categories(["Unknown"])
+    .fillna("Unknown")
+)
 
-pivot_raw = p_hist.groupby(["Year Bin", "Reg E Flag"], dropna=False).agg(**{"# of Accounts": ("AcctNo", "count")}).reset_index()
+pivot_raw = p_hist.groupby(["Year Bin", "Reg E Flag"], observed=True, dropna=False).agg(**{"# of Accounts": ("AcctNo", "count")}).reset_index()
 pivot_table = pivot_raw.pivot(index="Year Bin", columns="Reg E Flag", values="# of Accounts").fillna(0)
 
 reg_e_flags = sorted([c for c in pivot_table.columns if c is not None])
@@ -641,12 +898,13 @@ if opt_in_flag:
 else:
     pivot_table["Opt In %"] = 0.0
 
-# Grand Total
-grand_total_hist = pd.DataFrame(pivot_table.sum(numeric_only=True)).T
-grand_total_hist.index = ["Grand Total"]
+# Grand Total – written in place as a new index label rather than concat-ing a one-row frame
+grand_total_hist = pivot_table.sum(numeric_only=True)
 if opt_in_flag:
-    grand_total_hist["Opt In %"] = (grand_total_hist[opt_in_flag] / grand_total_hist["# of Accounts"] * 100).fillna(0)
-pivot_table = pd.concat([pivot_table, grand_total_hist])
+    n_hist = grand_total_hist["# of Accounts"]
+    grand_total_hist["Opt In %"] = grand_total_hist[opt_in_flag] / n_hist * 100 if n_hist else 0.0
+pivot_table.index = pivot_table.index.astype(object)
+pivot_table.loc["Grand Total"] = grand_total_hist
 
 # Clean types
 int_cols = [c for c in pivot_table.columns if c in reg_e_flags or "# of" in c]
@@ -677,55 +935,54 @@ title_slide = prs.slides.add_slide(prs.slide_layouts[0])
 title_slide.shapes.title.text = "ILS Kickoff Analysis"
 title_slide.placeholders[1].text = f"Client 1774 · {datetime.now().strftime('%B %Y')}"
 
-# Slide 1 - Account Status
-add_slide_with_table(prs, "Account Status Analysis – All Accounts", stat_code_summary)
-
-# Slide 2 - Account Type
-add_slide_with_table(prs, "Account Type Analysis – Open Accounts Only", acct_type_summary)
-
-# Slide 3 - Personal Deposits
-add_slide_with_table(prs, "Personal Account Deposit Analysis", personal_deposit_summary)
-
-# Slide 4 - Business Deposits
-add_slide_with_table(prs, "Business Account Deposit Analysis", business_deposit_summary)
-
-# Slide 5 - Personal NSF Strat (Volume)
-add_slide_with_table(prs, "Personal NSF/OD Stratification – Volume", nsf_strat1)
-
-# Slide 6 - Business NSF Strat (Volume)
-add_slide_with_table(prs, "Business NSF/OD Stratification – Volume", nsf_strat_biz)
-
-# Slide 7 - Personal NSF + Pay Ratio
-add_slide_with_table(prs, "Personal NSF/OD Stratification – Pay Ratio", nsf_pay_p)
-
-# Slide 8 - Business NSF + Pay Ratio
-add_slide_with_table(prs, "Business NSF/OD Stratification – Pay Ratio", nsf_pay_b)
-
-# Slide 9 - Personal NSF + Deposits + Swipes
-add_slide_with_table(prs, "Personal NSF/OD – Full Behavioral Metrics", nsf_deps_p)
-
-# Slide 10 - Business NSF + Deposits + Swipes
-add_slide_with_table(prs, "Business NSF/OD – Full Behavioral Metrics", nsf_deps_b)
+# Every analysis as (slide title, Excel tab name, frame): one table slide each, in deck
+# order, and the same order for the workbook tabs in section 6
+REPORT = [
+    ("Account Status Analysis – All Accounts", "Stat_Code_Analysis", stat_code_summary),
+    ("Account Type Analysis – Open Accounts Only", "Account_Type", acct_type_summary),
+    ("Personal Account Deposit Analysis", "Personal_Deposits", personal_deposit_summary),
+    ("Business Account Deposit Analysis", "Business_Deposits", business_deposit_summary),
+    ("Personal NSF/OD Stratification – Volume", "NSF_Strat_Personal", nsf_strat1),
+    ("Business NSF/OD Stratification – Volume", "NSF_Strat_Business", nsf_strat_biz),
+    ("Personal NSF/OD Stratification – Pay Ratio", "NSF_PayRatio_Personal", nsf_pay_p),
+    ("Business NSF/OD Stratification – Pay Ratio", "NSF_PayRatio_Business", nsf_pay_b),
+    ("Personal NSF/OD – Full Behavioral Metrics", "NSF_Full_Personal", nsf_deps_p),
+    ("Business NSF/OD – Full Behavioral Metrics", "NSF_Full_Business", nsf_deps_b),
+    ("Personal OD Status Code Stratification", "OD_Status_Personal", od_status_personal),
+    ("Business OD Status Code Stratification", "OD_Status_Business", od_status_business),
+    ("Reg E Distribution – Personal Open Accounts", "Reg_E_Summary", reg_e_summary),
+    ("Personal OD Limit Stratification", "OD_Limit_Strat", od_limit_summary),
+    ("Historical Reg E Opt-In by Year Opened", "Historical_Reg_E", pivot_table),
+]
 
-# Slide 11 - Personal OD Status
-add_slide_with_table(prs, "Personal OD Status Code Stratification", od_status_personal)
+for title, _, data_df in REPORT:
+    add_slide_with_table(prs, title, data_df)
 
-# Slide 12 - Business OD Status
-add_slide_with_table(prs, "Business OD Status Code Stratification", od_status_business)
+# Save
+# Build the zip in memory and hand it to the OS in a single write. This runs on a
+# worker thread (zlib releases the GIL) so it overlaps the Excel build below
+pptx_path = Path("1774_ILS_Kickoff_Presentation.pptx")
 
-# Slide 13 - Reg E Summary
-add_slide_with_table(prs, "Reg E Distribution – Personal Open Accounts", reg_e_summary)
 
-# Slide 14 - OD Limit Stratification
-add_slide_with_table(prs, "Personal OD Limit Stratification", od_limit_summary)
+def save_pptx():
+    """Serialize the deck to pptx_path at ZIP_LEVEL (default level if python-pptx changed)."""
+    pptx_buf = io.BytesIO()
+    original_write = getattr(_ZipPkgWriter, "write", None)
+    patch = original_write is not None and hasattr(_ZipPkgWriter, "_zipf")
+    if patch:
+        _ZipPkgWriter.write = lambda self, pack_uri, blob: self._zipf.writestr(
+            pack_uri.membername, blob, compresslevel=ZIP_LEVEL
+        )
+    try:
+        prs.save(pptx_buf)
+    finally:
+        if patch:
+            _ZipPkgWriter.write = original_write
+    pptx_path.write_bytes(pptx_buf.getbuffer())
 
-# Slide 15 - Historical Reg E
-add_slide_with_table(prs, "Historical Reg E Opt-In by Year Opened", pivot_table)
 
-# Save
-pptx_path = "1774_ILS_Kickoff_Presentation.pptx"
-prs.save(pptx_path)
-print(f"✓ PowerPoint saved: {pptx_path}")
+save_pool = ThreadPoolExecutor(max_workers=1)
+pptx_saved = save_pool.submit(save_pptx)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -734,18 +991,8 @@ print(f"✓ PowerPoint saved: {pptx_path}")
 print("\n═══ Generating Excel Report ═══")
 
 now = datetime.now()
-month_abbr = calendar.month_abbr[now.month].upper()
-year_short = str(now.year)[-2:]
-excel_path = Path(f"1774_ILS_Kickoff_Report_{month_abbr}{year_short}.xlsx")
-
-# Create workbook with cover sheet
-wb = Workbook()
-ws = wb.active
-ws.title = "Report Info"
-ws["A1"] = "ILS Kickoff Report"
-ws["A1"].font = Font(size=20, bold=True)
-ws["A3"] = "Report Details:"
-ws["A3"].font = Font(size=14, bold=True)
+stamp = now.strftime("%b%y").upper()  # e.g. FEB26
+excel_path = Path(f"1774_ILS_Kickoff_Report_{stamp}.xlsx")
 
 report_info = [
     ("Client ID:", "1774"),
@@ -753,45 +1000,53 @@ report_info = [
     ("Source File:", DATA_PATH.name),
     ("Total Accounts:", f"{len(df):,}"),
 ]
-for i, (label, value) in enumerate(report_info, start=4):
-    ws[f"A{i}"] = label
-    ws[f"A{i}"].font = Font(bold=True)
-    ws[f"B{i}"] = value
-
-ws.column_dimensions["A"].width = 20
-ws.column_dimensions["B"].width = 40
-wb.save(excel_path)
-wb.close()
-
-# Write each analysis as a tab
-tabs = [
-    ("Stat_Code_Analysis", stat_code_summary),
-    ("Account_Type", acct_type_summary),
-    ("Personal_Deposits", personal_deposit_summary),
-    ("Business_Deposits", business_deposit_summary),
-    ("NSF_Strat_Personal", nsf_strat1),
-    ("NSF_Strat_Business", nsf_strat_biz),
-    ("NSF_PayRatio_Personal", nsf_pay_p),
-    ("NSF_PayRatio_Business", nsf_pay_b),
-    ("NSF_Full_Personal", nsf_deps_p),
-    ("NSF_Full_Business", nsf_deps_b),
-    ("OD_Status_Personal", od_status_personal),
-    ("OD_Status_Business", od_status_business),
-    ("Reg_E_Summary", reg_e_summary),
-    ("OD_Limit_Strat", od_limit_summary),
-    ("Historical_Reg_E", pivot_table),
+
+# Cover sheet + every analysis tab are rendered as worksheet XML and zipped once
+# Shared-strings table for this workbook (text -> index), filled as cells are rendered
+# so repeated labels across all tabs are stored once
+shared_strings = {}
+
+# Every label cell shares the one bold style (XLSX_BOLD) rather than a per-cell font
+cover_rows = [
+    [xlsx_str_cell(shared_strings, "A1", "ILS Kickoff Report", XLSX_TITLE)],
+    [],
+    [xlsx_str_cell(shared_strings, "A3", "Report Details:", XLSX_HEADING)],
+] + [
+    [xlsx_str_cell(shared_strings, f"A{i}", label, XLSX_BOLD), xlsx_str_cell(shared_strings, f"B{i}", value)]
+    for i, (label, value) in enumerate(report_info, start=4)
 ]
+cover_cols = (
+    '<cols><col min="1" max="1" width="20.7109375" customWidth="1"/>'
+    '<col min="2" max="2" width="40.7109375" customWidth="1"/></cols>'
+)
+
+# Each worksheet is streamed into its zip member row by row, so peak memory stays at one
+# row of XML per tab; the package is assembled in memory and written in a single call
+excel_buf = io.BytesIO()
+with zipfile.ZipFile(excel_buf, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_LEVEL) as zf:
+    xlsx_write_part(zf, "xl/worksheets/sheet1.xml", xlsx_sheet_chunks(cover_rows, cover_cols))
 
-for sheet_name, data_df in tabs:
-    with pd.ExcelWriter(str(excel_path), engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
-        data_df.to_excel(writer, sheet_name=sheet_name, index=False)
-    print(f"  ✓ {sheet_name}")
+    # Write each analysis as a tab
+    for n, (_, sheet_name, data_df) in enumerate(REPORT, start=2):
+        xlsx_write_part(zf, f"xl/worksheets/sheet{n}.xml", xlsx_tab_chunks(trim(data_df), shared_strings))
+        print(f"  ✓ {sheet_name}")
 
+    # Package parts last: sharedStrings.xml needs every string the sheets referenced
+    for part_name, xml in xlsx_workbook_parts(["Report Info"] + [name for _, name, _ in REPORT], shared_strings):
+        zf.writestr(part_name, xml)
+
+excel_path.write_bytes(excel_buf.getbuffer())
 print(f"✓ Excel saved: {excel_path}")
 
-# Cleanup temp chart files
+pptx_saved.result()  # re-raises any error from the deck save
+save_pool.shutdown()
+print(f"✓ PowerPoint saved: {pptx_path}")
+
+# Cleanup temp chart files – unlink directly rather than stat-then-remove
 for f in chart_files:
-    if os.path.exists(f):
-        os.remove(f)
+    try:
+        os.unlink(f)
+    except FileNotFoundError:
+        pass
 
 print("\n═══ DONE ═══")